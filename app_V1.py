@@ -3,15 +3,18 @@ import time
 import gc
 import ctypes
 from ctypes import wintypes
+from concurrent.futures import ThreadPoolExecutor
 import psutil
 
 from PySide6.QtCore import Qt, QTimer, QPoint, QThread, Signal, QSize, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap, QAction
+from PySide6.QtGui import QColor, QFont, QAction
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QHBoxLayout, QVBoxLayout, QToolButton,
     QFrame, QSystemTrayIcon, QMenu, QGraphicsDropShadowEffect
 )
 
+from icons import tray_icon
+
 # ============== Windows API bindings for working set trimming ==============
 kernel32 = ctypes.windll.kernel32
 psapi = ctypes.windll.psapi
@@ -31,14 +34,32 @@ EmptyWorkingSet.restype = wintypes.BOOL
 GetCurrentProcess = kernel32.GetCurrentProcess
 GetCurrentProcess.restype = wintypes.HANDLE
 
-PROCESS_QUERY_INFORMATION = 0x0400
+# EmptyWorkingSet only needs query + set-quota rights. PROCESS_QUERY_INFORMATION
+# (0x0400) is a superset of the limited right and is not required here.
 PROCESS_SET_QUOTA = 0x0100
 PROCESS_QUERY_LIMITED_INFORMATION = 0x1000  # Vista+
 
+TRIM_WORKERS = 16
+
 # ============== Memory cleaner thread ==============
 class MemoryCleaner(QThread):
     finished_with_freed = Signal(int)
 
+    @staticmethod
+    def trim(pid: int):
+        # Skip if we can't safely open
+        h = None
+        try:
+            # Limited info + set quota is all EmptyWorkingSet needs
+            h = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_SET_QUOTA, False, pid)
+            if h:
+                EmptyWorkingSet(h)
+        except Exception:
+            pass
+        finally:
+            if h:
+                CloseHandle(h)
+
     def run(self):
         # Measure available RAM before cleaning
         before = psutil.virtual_memory().available
@@ -51,26 +72,11 @@ class MemoryCleaner(QThread):
             pass
 
         # Try trimming other processes we can open (no admin required for same-user, non-protected)
-        for p in psutil.process_iter(attrs=["pid", "name", "username"]):
-            pid = p.info["pid"]
-            # Avoid trimming critical/system-like processes
-            if pid in (0, 4):  # System Idle, System
-                continue
-            # Skip if we can't safely open
-            h = None
-            try:
-                # First try with full needed rights
-                h = OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_SET_QUOTA, False, pid)
-                if not h:
-                    # Try limited info + set quota (some processes allow this)
-                    h = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_SET_QUOTA, False, pid)
-                if h:
-                    EmptyWorkingSet(h)
-            except Exception:
-                pass
-            finally:
-                if h:
-                    CloseHandle(h)
+        # Avoid trimming critical/system-like processes
+        pids = [pid for pid in psutil.pids() if pid not in (0, 4)]  # System Idle, System
+        # ctypes releases the GIL around each call, so trims overlap across threads
+        with ThreadPoolExecutor(max_workers=TRIM_WORKERS) as ex:
+            list(ex.map(self.trim, pids))
 
         # Measure again
         after = psutil.virtual_memory().available
@@ -80,30 +86,6 @@ class MemoryCleaner(QThread):
         self.finished_with_freed.emit(int(freed))
 
 
-# ============== Utility: create a simple icon with an emoji ==============
-def emoji_icon(emoji: str, size: int = 128, bg=QColor(32, 48, 79), fg=QColor(220, 230, 255)):
-    pm = QPixmap(size, size)
-    pm.fill(Qt.transparent)
-
-    painter = QPainter(pm)
-    painter.setRenderHint(QPainter.Antialiasing, True)
-    # Background circle
-    painter.setBrush(bg)
-    painter.setPen(Qt.NoPen)
-    painter.drawEllipse(0, 0, size, size)
-
-    # Emoji
-    font = QFont()
-    font.setPointSize(int(size * 0.55))
-    painter.setFont(font)
-    painter.setPen(fg)
-    # Center the emoji
-    rect = pm.rect()
-    painter.drawText(rect, Qt.AlignCenter, emoji)
-    painter.end()
-    return QIcon(pm)
-
-
 # ============== Main Widget ==============
 class MonitorWidget(QWidget):
     def __init__(self):
@@ -195,7 +177,7 @@ class MonitorWidget(QWidget):
         self.action_btn.clicked.connect(self.open_task_manager)
 
         # Tray icon
-        self.tray = QSystemTrayIcon(emoji_icon("🚀"), self)
+        self.tray = QSystemTrayIcon(tray_icon(), self)
         self.tray.setToolTip("RAM/CPU Widget")
         tray_menu = QMenu()
         act_clean = QAction("Clean RAM", self)
@@ -277,6 +259,9 @@ class MonitorWidget(QWidget):
         anim.start(QPropertyAnimation.DeletionPolicy.DeleteWhenStopped)
 
     def clean_memory(self):
+        # The button is disabled while cleaning, but the tray action is not
+        if getattr(self, "cleaner", None) and self.cleaner.isRunning():
+            return
         self.set_cleaning_ui(True)
         self.cleaner = MemoryCleaner()
         self.cleaner.finished_with_freed.connect(self.on_clean_done)
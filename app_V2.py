@@ -2,17 +2,20 @@ import sys
 import gc
 import ctypes
 from ctypes import wintypes
+from concurrent.futures import ThreadPoolExecutor
 import html
 
 import psutil
 
 from PySide6.QtCore import Qt, QTimer, QPoint, QThread, Signal, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap, QAction
+from PySide6.QtGui import QColor, QFont, QAction
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QHBoxLayout, QVBoxLayout, QToolButton,
     QFrame, QSystemTrayIcon, QMenu, QGraphicsDropShadowEffect
 )
 
+from icons import emoji_icon, tray_icon
+
 # ---------------- Windows API bindings for working set trimming ----------------
 kernel32 = ctypes.windll.kernel32
 psapi = ctypes.windll.psapi
@@ -32,14 +35,30 @@ EmptyWorkingSet.restype = wintypes.BOOL
 GetCurrentProcess = kernel32.GetCurrentProcess
 GetCurrentProcess.restype = wintypes.HANDLE
 
-PROCESS_QUERY_INFORMATION = 0x0400
+# EmptyWorkingSet only needs query + set-quota rights. PROCESS_QUERY_INFORMATION
+# (0x0400) is a superset of the limited right and is not required here.
 PROCESS_SET_QUOTA = 0x0100
 PROCESS_QUERY_LIMITED_INFORMATION = 0x1000  # Vista+
 
+TRIM_WORKERS = 16
+
 # ---------------- Memory cleaner thread ----------------
 class MemoryCleaner(QThread):
     finished_with_freed = Signal(int)
 
+    @staticmethod
+    def trim(pid: int):
+        h = None
+        try:
+            h = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_SET_QUOTA, False, pid)
+            if h:
+                EmptyWorkingSet(h)
+        except Exception:
+            pass
+        finally:
+            if h:
+                CloseHandle(h)
+
     def run(self):
         before = psutil.virtual_memory().available
 
@@ -49,22 +68,10 @@ class MemoryCleaner(QThread):
         except Exception:
             pass
 
-        for p in psutil.process_iter(attrs=["pid", "name", "username"]):
-            pid = p.info["pid"]
-            if pid in (0, 4):
-                continue
-            h = None
-            try:
-                h = OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_SET_QUOTA, False, pid)
-                if not h:
-                    h = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_SET_QUOTA, False, pid)
-                if h:
-                    EmptyWorkingSet(h)
-            except Exception:
-                pass
-            finally:
-                if h:
-                    CloseHandle(h)
+        # ctypes releases the GIL around each call, so trims overlap across threads
+        pids = [pid for pid in psutil.pids() if pid not in (0, 4)]
+        with ThreadPoolExecutor(max_workers=TRIM_WORKERS) as ex:
+            list(ex.map(self.trim, pids))
 
         after = psutil.virtual_memory().available
         freed = after - before
@@ -72,24 +79,6 @@ class MemoryCleaner(QThread):
             freed = 0
         self.finished_with_freed.emit(int(freed))
 
-# ---------------- Utility: build an icon with an emoji ----------------
-def emoji_icon(emoji: str, size: int = 128,
-               bg=QColor(32, 48, 79), fg=QColor(220, 230, 255)) -> QIcon:
-    pm = QPixmap(size, size)
-    pm.fill(Qt.transparent)
-    painter = QPainter(pm)
-    painter.setRenderHint(QPainter.Antialiasing, True)
-    painter.setBrush(bg)
-    painter.setPen(Qt.NoPen)
-    painter.drawEllipse(0, 0, size, size)
-    font = QFont()
-    font.setPointSize(int(size * 0.55))
-    painter.setFont(font)
-    painter.setPen(fg)
-    painter.drawText(pm.rect(), Qt.AlignCenter, emoji)
-    painter.end()
-    return QIcon(pm)
-
 # ---------------- Main widget ----------------
 class MonitorWidget(QWidget):
     def __init__(self):
@@ -203,7 +192,7 @@ class MonitorWidget(QWidget):
         self.action_btn.clicked.connect(self.open_task_manager)
 
         # Tray
-        self.tray = QSystemTrayIcon(emoji_icon("🚀"), self)
+        self.tray = QSystemTrayIcon(tray_icon(), self)
         self.tray.setToolTip("RAM/CPU Widget")
         tray_menu = QMenu()
         act_show = QAction("Show/Hide", self)
@@ -298,6 +287,9 @@ class MonitorWidget(QWidget):
         self.toast_anim.start()
 
     def clean_memory(self):
+        # The button is disabled while cleaning, but the tray action is not
+        if getattr(self, "cleaner", None) and self.cleaner.isRunning():
+            return
         self.set_cleaning_ui(True)
         self.cleaner = MemoryCleaner()
         self.cleaner.finished_with_freed.connect(self.on_clean_done)
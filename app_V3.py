@@ -2,19 +2,52 @@ import sys
 import gc
 import ctypes
 from ctypes import wintypes
+from concurrent.futures import ThreadPoolExecutor
 
 import psutil
 
-from PySide6.QtCore import Qt, QTimer, QPoint, QThread, Signal, QPropertyAnimation, QEasingCurve
-from PySide6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap, QAction, QFontMetrics
+from PySide6.QtCore import (
+    Qt, QObject, QPoint, QRect, QRectF, QThread, Signal, Slot, QPropertyAnimation,
+    QVariantAnimation, QEasingCurve
+)
+from PySide6.QtGui import QColor, QFont, QPainter, QPixmap, QAction, QFontMetrics
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLabel, QHBoxLayout, QVBoxLayout, QToolButton,
-    QFrame, QSystemTrayIcon, QMenu, QGraphicsDropShadowEffect
+    QFrame, QSystemTrayIcon, QMenu, QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
 )
 
+from icons import emoji_icon, tray_icon
+
+# ---------------- Panel stylesheet ----------------
+PANEL_QSS = """
+QFrame#panel {
+    background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 rgba(20,31,52,230), stop:1 rgba(13,24,42,230));
+    border: 1px solid rgba(255,255,255,22);
+    border-radius: 18px;
+}
+QLabel {
+    color: #D6E2FF;
+    font-size: 12pt;
+    font-weight: 600;
+}
+QToolButton {
+    background-color: rgba(255,255,255,18);
+    border: 1px solid rgba(255,255,255,22);
+    border-radius: 14px;
+    color: #D6E2FF;
+    font-weight: 700;
+    padding: 2px 6px;
+    min-width: 28px; min-height: 28px;
+}
+QToolButton:hover { background-color: rgba(255,255,255,26); }
+QToolButton:pressed { background-color: rgba(255,255,255,34); }
+"""
+
 # ---------------- Windows API bindings for working set trimming ----------------
 kernel32 = ctypes.windll.kernel32
 psapi = ctypes.windll.psapi
+wtsapi32 = ctypes.windll.wtsapi32
 
 OpenProcess = kernel32.OpenProcess
 OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
@@ -24,73 +57,258 @@ CloseHandle = kernel32.CloseHandle
 CloseHandle.argtypes = [wintypes.HANDLE]
 CloseHandle.restype = wintypes.BOOL
 
-EmptyWorkingSet = psapi.EmptyWorkingSet
-EmptyWorkingSet.argtypes = [wintypes.HANDLE]
-EmptyWorkingSet.restype = wintypes.BOOL
+SetProcessWorkingSetSizeEx = kernel32.SetProcessWorkingSetSizeEx
+SetProcessWorkingSetSizeEx.argtypes = [wintypes.HANDLE, ctypes.c_ssize_t, ctypes.c_ssize_t, wintypes.DWORD]
+SetProcessWorkingSetSizeEx.restype = wintypes.BOOL
+
+class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ("cb", wintypes.DWORD),
+        ("PageFaultCount", wintypes.DWORD),
+        ("PeakWorkingSetSize", ctypes.c_size_t),
+        ("WorkingSetSize", ctypes.c_size_t),
+        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+        ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+        ("PagefileUsage", ctypes.c_size_t),
+        ("PeakPagefileUsage", ctypes.c_size_t),
+    ]
+
+GetProcessMemoryInfo = psapi.GetProcessMemoryInfo
+GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+GetProcessMemoryInfo.restype = wintypes.BOOL
 
 GetCurrentProcess = kernel32.GetCurrentProcess
 GetCurrentProcess.restype = wintypes.HANDLE
 
-PROCESS_QUERY_INFORMATION = 0x0400
+GetCurrentProcessId = kernel32.GetCurrentProcessId
+GetCurrentProcessId.restype = wintypes.DWORD
+
+ProcessIdToSessionId = kernel32.ProcessIdToSessionId
+ProcessIdToSessionId.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+ProcessIdToSessionId.restype = wintypes.BOOL
+
+class WTS_PROCESS_INFOW(ctypes.Structure):
+    _fields_ = [
+        ("SessionId", wintypes.DWORD),
+        ("ProcessId", wintypes.DWORD),
+        ("pProcessName", wintypes.LPWSTR),
+        ("pUserSid", ctypes.c_void_p),
+    ]
+
+WTSEnumerateProcessesW = wtsapi32.WTSEnumerateProcessesW
+WTSEnumerateProcessesW.argtypes = [
+    wintypes.HANDLE, wintypes.DWORD, wintypes.DWORD,
+    ctypes.POINTER(ctypes.POINTER(WTS_PROCESS_INFOW)), ctypes.POINTER(wintypes.DWORD)
+]
+WTSEnumerateProcessesW.restype = wintypes.BOOL
+
+WTSFreeMemory = wtsapi32.WTSFreeMemory
+WTSFreeMemory.argtypes = [ctypes.c_void_p]
+WTSFreeMemory.restype = None
+
+WTS_CURRENT_SERVER_HANDLE = None
+
+# Trimming and reading the working set size only need query + set-quota rights.
+# PROCESS_QUERY_INFORMATION (0x0400) is a superset of the limited right and is
+# not required here.
 PROCESS_SET_QUOTA = 0x0100
 PROCESS_QUERY_LIMITED_INFORMATION = 0x1000  # Vista+
 
-# ---------------- Memory cleaner thread ----------------
-class MemoryCleaner(QThread):
-    finished_with_freed = Signal(int)
+QUOTA_LIMITS_HARDWS_MIN_DISABLE = 0x00000002
+QUOTA_LIMITS_HARDWS_MAX_DISABLE = 0x00000008
+
+# ---------------- Windows API bindings for stats sampling ----------------
+class MEMORYSTATUSEX(ctypes.Structure):
+    _fields_ = [
+        ("dwLength", wintypes.DWORD),
+        ("dwMemoryLoad", wintypes.DWORD),
+        ("ullTotalPhys", ctypes.c_ulonglong),
+        ("ullAvailPhys", ctypes.c_ulonglong),
+        ("ullTotalPageFile", ctypes.c_ulonglong),
+        ("ullAvailPageFile", ctypes.c_ulonglong),
+        ("ullTotalVirtual", ctypes.c_ulonglong),
+        ("ullAvailVirtual", ctypes.c_ulonglong),
+        ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+    ]
+
+GlobalMemoryStatusEx = kernel32.GlobalMemoryStatusEx
+GlobalMemoryStatusEx.argtypes = [ctypes.POINTER(MEMORYSTATUSEX)]
+GlobalMemoryStatusEx.restype = wintypes.BOOL
+
+GetSystemTimes = kernel32.GetSystemTimes
+GetSystemTimes.argtypes = [ctypes.POINTER(wintypes.FILETIME)] * 3
+GetSystemTimes.restype = wintypes.BOOL
+
+def filetime_ticks(ft: wintypes.FILETIME) -> int:
+    return (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+
+TRIM_WORKERS = 16
+
+# Pre-built "NN%" label texts, prefixed with LRM to ensure LTR rendering in plain text
+_PCT = tuple(f"\u200e{i}%" for i in range(101))
+
+def pct_index(value: float) -> int:
+    return min(int(round(value)), 100)
+
+def working_set_size(h):
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    if GetProcessMemoryInfo(h, ctypes.byref(counters), counters.cb):
+        return counters.WorkingSetSize
+    return None
+
+# Trim the process behind handle h; returns how many bytes its working set shrank
+def trim_working_set(h) -> int:
+    before = working_set_size(h)
+    # (-1, -1) removes as many pages as possible, like EmptyWorkingSet. The flags
+    # also clear any hard working-set limits the target had set on itself.
+    if not SetProcessWorkingSetSizeEx(
+            h, -1, -1, QUOTA_LIMITS_HARDWS_MIN_DISABLE | QUOTA_LIMITS_HARDWS_MAX_DISABLE):
+        return 0
+    after = working_set_size(h)
+    if before is None or after is None:
+        return 0
+    return max(0, before - after)
+
+def session_id(pid: int):
+    sid = wintypes.DWORD()
+    if ProcessIdToSessionId(pid, ctypes.byref(sid)):
+        return sid.value
+    return None
+
+# PIDs in the given session, from one process snapshot (None if it can't be taken)
+def session_pids(session: int):
+    info = ctypes.POINTER(WTS_PROCESS_INFOW)()
+    count = wintypes.DWORD()
+    if not WTSEnumerateProcessesW(WTS_CURRENT_SERVER_HANDLE, 0, 1,
+                                  ctypes.byref(info), ctypes.byref(count)):
+        return None
+    try:
+        return {info[i].ProcessId for i in range(count.value) if info[i].SessionId == session}
+    finally:
+        WTSFreeMemory(info)
+
+# ---------------- Memory cleaner worker (lives on a long-lived QThread) ----------------
+class CleanerWorker(QObject):
+    finished_with_freed = Signal(object)  # Python int; totals can exceed 32 bits
 
-    def run(self):
-        before = psutil.virtual_memory().available
+    def __init__(self):
+        super().__init__()
+        # Trim pool lives as long as the worker; threads are spawned on first use
+        self._pool = ThreadPoolExecutor(max_workers=TRIM_WORKERS)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
 
-        gc.collect()
+    @staticmethod
+    def trim(pid: int) -> int:
+        h = None
         try:
-            EmptyWorkingSet(GetCurrentProcess())
+            h = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_SET_QUOTA, False, pid)
+            if h:
+                return trim_working_set(h)
         except Exception:
             pass
+        finally:
+            if h:
+                CloseHandle(h)
+        return 0
 
-        for p in psutil.process_iter(attrs=["pid", "name", "username"]):
-            pid = p.info["pid"]
-            if pid in (0, 4):
-                continue
-            h = None
+    @Slot()
+    def run(self):
+        freed = 0
+        try:
+            gc.collect()
             try:
-                h = OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_SET_QUOTA, False, pid)
-                if not h:
-                    h = OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION | PROCESS_SET_QUOTA, False, pid)
-                if h:
-                    EmptyWorkingSet(h)
+                freed += trim_working_set(GetCurrentProcess())
             except Exception:
                 pass
-            finally:
-                if h:
-                    CloseHandle(h)
 
-        after = psutil.virtual_memory().available
-        freed = after - before
-        if freed < 0:
+            pids = set(psutil.pids()) - {0, 4}  # System Idle, System
+
+            # Other sessions' processes are dropped up front, before any OpenProcess
+            session = session_id(GetCurrentProcessId())
+            same_session = session_pids(session) if session is not None else None
+            if same_session is not None:
+                pids &= same_session
+
+            # ctypes releases the GIL around each call, so trims overlap across threads
+            # Sum of working-set shrinkage. Shared pages (e.g. DLL images) are counted once
+            # per process that had them mapped, so this is an upper bound on RAM returned.
+            freed += sum(self._pool.map(self.trim, pids))
+        except Exception:
             freed = 0
-        self.finished_with_freed.emit(int(freed))
-
-# ---------------- Utility: build an icon with an emoji ----------------
-def emoji_icon(emoji: str, size: int = 128,
-               bg=QColor(32, 48, 79), fg=QColor(220, 230, 255)) -> QIcon:
-    pm = QPixmap(size, size)
-    pm.fill(Qt.transparent)
-    painter = QPainter(pm)
+        finally:
+            # Always report back so the UI never stays stuck in the cleaning state
+            self.finished_with_freed.emit(int(freed))
+
+# ---------------- Stats sampler thread ----------------
+class StatsSampler(QThread):
+    sample_ready = Signal(float, float)
+
+    def run(self):
+        mem = MEMORYSTATUSEX()
+        mem.dwLength = ctypes.sizeof(mem)
+        idle, kernel, user = wintypes.FILETIME(), wintypes.FILETIME(), wintypes.FILETIME()
+        last_idle = last_total = None
+
+        # Prime the CPU counters so the first sample already has a real delta
+        if GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+            last_idle = filetime_ticks(idle)
+            last_total = filetime_ticks(kernel) + filetime_ticks(user)
+            self.msleep(250)
+
+        while not self.isInterruptionRequested():
+            ram = 0.0
+            if GlobalMemoryStatusEx(ctypes.byref(mem)) and mem.ullTotalPhys:
+                ram = (mem.ullTotalPhys - mem.ullAvailPhys) * 100.0 / mem.ullTotalPhys
+
+            # CPU busy share since the previous sample (kernel time includes idle time)
+            cpu = 0.0
+            if GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+                idle_t = filetime_ticks(idle)
+                total_t = filetime_ticks(kernel) + filetime_ticks(user)
+                if last_total is not None and total_t > last_total:
+                    cpu = 100.0 * (1.0 - (idle_t - last_idle) / (total_t - last_total))
+                last_idle, last_total = idle_t, total_t
+
+            self.sample_ready.emit(ram, min(max(cpu, 0.0), 100.0))
+            self.msleep(1000)
+
+# ---------------- Utility: pre-render a soft drop shadow ----------------
+def shadow_pixmap(width: int, height: int, rect: QRect, radius: float = 18,
+                  blur: float = 24, offset=QPoint(0, 4),
+                  color=QColor(0, 0, 0, 160)) -> QPixmap:
+    # Rounded-rect silhouette, blurred once through a throwaway scene
+    src = QPixmap(width, height)
+    src.fill(Qt.transparent)
+    painter = QPainter(src)
     painter.setRenderHint(QPainter.Antialiasing, True)
-    painter.setBrush(bg)
     painter.setPen(Qt.NoPen)
-    painter.drawEllipse(0, 0, size, size)
-    font = QFont()
-    font.setPointSize(int(size * 0.55))
-    painter.setFont(font)
-    painter.setPen(fg)
-    painter.drawText(pm.rect(), Qt.AlignCenter, emoji)
+    painter.setBrush(color)
+    painter.drawRoundedRect(QRectF(rect.translated(offset)), radius, radius)
     painter.end()
-    return QIcon(pm)
+
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(src)
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur)
+    item.setGraphicsEffect(effect)
+    scene.addItem(item)
+
+    out = QPixmap(width, height)
+    out.fill(Qt.transparent)
+    painter = QPainter(out)
+    scene.render(painter, QRectF(out.rect()), QRectF(src.rect()))
+    painter.end()
+    return out
 
 # ---------------- Main widget ----------------
 class MonitorWidget(QWidget):
+    clean_requested = Signal()
+
     def __init__(self):
         super().__init__()
 
@@ -98,40 +316,13 @@ class MonitorWidget(QWidget):
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint | Qt.Tool)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.drag_pos = QPoint()
-        psutil.cpu_percent(interval=None)  # prime first call
 
         # Panel
         self.panel = QFrame(self)
         self.panel.setObjectName("panel")
-        self.panel.setStyleSheet("""
-            QFrame#panel {
-                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(20,31,52,230), stop:1 rgba(13,24,42,230));
-                border: 1px solid rgba(255,255,255,22);
-                border-radius: 18px;
-            }
-            QLabel {
-                color: #D6E2FF;
-                font-size: 12pt;
-                font-weight: 600;
-            }
-            QToolButton {
-                background-color: rgba(255,255,255,18);
-                border: 1px solid rgba(255,255,255,22);
-                border-radius: 14px;
-                color: #D6E2FF;
-                font-weight: 700;
-                padding: 2px 6px;
-                min-width: 28px; min-height: 28px;
-            }
-            QToolButton:hover { background-color: rgba(255,255,255,26); }
-            QToolButton:pressed { background-color: rgba(255,255,255,34); }
-        """)
-        shadow = QGraphicsDropShadowEffect(self.panel)
-        shadow.setBlurRadius(24)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(0, 0, 0, 160))
-        self.panel.setGraphicsEffect(shadow)
+        self.panel.setStyleSheet(PANEL_QSS)
+        # Shadow is rendered once per size and painted behind the panel (see paintEvent)
+        self._shadow = None
 
         # Controls
         self.clean_btn = QToolButton(self.panel)
@@ -205,18 +396,33 @@ class MonitorWidget(QWidget):
         self._last_ram_i = -1
         self._last_cpu_i = -1
 
-        # Timer (faster for smoother motion)
-        self.timer = QTimer(self)
-        self.timer.setInterval(200)
-        self.timer.timeout.connect(self.update_stats)
-        self.timer.start()
+        # Animations easing the displayed values toward each new sample
+        self.ram_anim = self.make_value_anim(self.on_ram_value)
+        self.cpu_anim = self.make_value_anim(self.on_cpu_value)
+
+        # Sampler thread (RAM/CPU are read once per second off the GUI thread)
+        self.sampler = StatsSampler(self)
+        self.sampler.sample_ready.connect(self.on_sample, Qt.QueuedConnection)
+        self.sampler.start()
+
+        # Cleaner worker (one thread for the app's lifetime, triggered via clean_requested)
+        self._cleaning = False
+        self._worker_thread = QThread(self)
+        self._worker = CleanerWorker()
+        self._worker.moveToThread(self._worker_thread)
+        self.clean_requested.connect(self._worker.run)
+        self._worker.finished_with_freed.connect(self.on_clean_done)
+        self._worker_thread.finished.connect(self._worker.deleteLater)
+        self._worker_thread.start()
+
+        QApplication.instance().aboutToQuit.connect(self.stop_threads)
 
         # Actions
         self.clean_btn.clicked.connect(self.clean_memory)
         self.action_btn.clicked.connect(self.open_task_manager)
 
         # Tray
-        self.tray = QSystemTrayIcon(emoji_icon("🚀"), self)
+        self.tray = QSystemTrayIcon(tray_icon(), self)
         self.tray.setToolTip("RAM/CPU Widget")
         tray_menu = QMenu()
         act_show = QAction("Show/Hide", self)
@@ -242,7 +448,6 @@ class MonitorWidget(QWidget):
         # Size/pos
         self.resize(380, 50)
         self.move_to_corner()
-        self.update_stats()
 
     # ----- UI helpers -----
     def move_to_corner(self):
@@ -250,6 +455,17 @@ class MonitorWidget(QWidget):
         self.move(screen.right() - self.width() - 20,
                   screen.bottom() - self.height() - 20)
 
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._shadow = None
+
+    def paintEvent(self, event):
+        if self._shadow is None:
+            self._shadow = shadow_pixmap(self.width(), self.height(), self.panel.geometry())
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._shadow)
+        painter.end()
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
             self.drag_pos = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
@@ -261,42 +477,59 @@ class MonitorWidget(QWidget):
             event.accept()
 
     # ----- Stats/formatting -----
+    def make_value_anim(self, slot) -> QVariantAnimation:
+        anim = QVariantAnimation(self)
+        anim.setDuration(1000)
+        anim.setEasingCurve(QEasingCurve.InOutQuad)
+        anim.valueChanged.connect(slot)
+        return anim
+
     @staticmethod
-    def ltr_text(text: str) -> str:
-        # Prefix with LRM to ensure LTR rendering in plain text
-        return "\u200e" + text
-
-    def update_stats(self):
-        vm = psutil.virtual_memory()
-        ram = float(vm.percent)
-        cpu = float(psutil.cpu_percent(interval=None))
-
-        # Exponential smoothing
-        alpha = 0.3
-        if self._last_ram_i == -1 and self._last_cpu_i == -1 and self._disp_ram == 0.0 and self._disp_cpu == 0.0:
+    def restart_anim(anim: QVariantAnimation, start: float, end: float):
+        anim.stop()
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        anim.start()
+
+    def on_sample(self, ram: float, cpu: float):
+        if self._last_ram_i == -1 and self._last_cpu_i == -1:
+            # First sample: show it directly instead of easing up from 0%
+            self.on_ram_value(ram)
+            self.on_cpu_value(cpu)
+            return
+        # Only animate when the shown integer would change; otherwise the animation would
+        # run its ~60 Hz valueChanged callbacks for a second without touching the label
+        if pct_index(ram) == self._last_ram_i:
+            self.ram_anim.stop()
             self._disp_ram = ram
+        else:
+            self.restart_anim(self.ram_anim, self._disp_ram, ram)
+        if pct_index(cpu) == self._last_cpu_i:
+            self.cpu_anim.stop()
             self._disp_cpu = cpu
         else:
-            self._disp_ram += (ram - self._disp_ram) * alpha
-            self._disp_cpu += (cpu - self._disp_cpu) * alpha
-
-        ram_i = int(round(self._disp_ram))
-        cpu_i = int(round(self._disp_cpu))
-
-        updated_any = False
+            self.restart_anim(self.cpu_anim, self._disp_cpu, cpu)
+
+    def stop_threads(self):
+        self.sampler.requestInterruption()
+        self.sampler.wait()
+        self._worker.shutdown()
+        self._worker_thread.quit()
+        self._worker_thread.wait()
+
+    def on_ram_value(self, value: float):
+        self._disp_ram = value
+        ram_i = pct_index(value)
         if ram_i != self._last_ram_i:
-            self.ram_val.setText(self.ltr_text(f"{ram_i}%"))
+            self.ram_val.setText(_PCT[ram_i])
             self._last_ram_i = ram_i
-            updated_any = True
+
+    def on_cpu_value(self, value: float):
+        self._disp_cpu = value
+        cpu_i = pct_index(value)
         if cpu_i != self._last_cpu_i:
-            self.cpu_val.setText(self.ltr_text(f"{cpu_i}%"))
+            self.cpu_val.setText(_PCT[cpu_i])
             self._last_cpu_i = cpu_i
-            updated_any = True
-
-        # Ensure background behind labels is repainted to avoid ghosting
-        if updated_any:
-            self.panel.update(self.ram_val.geometry().adjusted(-2, -2, 2, 2))
-            self.panel.update(self.cpu_val.geometry().adjusted(-2, -2, 2, 2))
 
     # ----- Actions -----
     def open_task_manager(self):
@@ -310,12 +543,13 @@ class MonitorWidget(QWidget):
         self.clean_btn.setEnabled(not cleaning)
         self.action_btn.setEnabled(not cleaning)
         if cleaning:
-            self.ram_val.setText(self.ltr_text("..."))
-            self.cpu_val.setText(self.ltr_text("..."))
+            self.ram_val.setText("\u200e...")
+            self.cpu_val.setText("\u200e...")
 
     def show_freed_toast(self, freed_bytes: int):
         mb = max(0, freed_bytes // (1024 * 1024))
-        self.toast.setText(f"Freed {mb} MB")
+        # Summed working-set shrinkage (shared pages count per process), not freed RAM
+        self.toast.setText(f"Trimmed {mb} MB (working sets)")
         self.toast.adjustSize()
         self.toast.move(self.panel.width() - self.toast.width() - 10,
                         self.panel.height() + 2)
@@ -334,12 +568,15 @@ class MonitorWidget(QWidget):
         self.toast_anim.start()
 
     def clean_memory(self):
+        # The button is disabled while cleaning, but the tray action is not
+        if self._cleaning:
+            return
+        self._cleaning = True
         self.set_cleaning_ui(True)
-        self.cleaner = MemoryCleaner()
-        self.cleaner.finished_with_freed.connect(self.on_clean_done)
-        self.cleaner.start()
+        self.clean_requested.emit()
 
     def on_clean_done(self, freed_bytes: int):
+        self._cleaning = False
         self.set_cleaning_ui(False)
         self.show_freed_toast(freed_bytes)
 
@@ -0,0 +1,30 @@
+import functools
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QFont, QIcon, QPainter, QPixmap
+
+# ---------------- Utility: build an icon with an emoji ----------------
+# Cached per (emoji, size, colors); colors are RGB tuples so they hash by value
+@functools.lru_cache(maxsize=32)
+def emoji_icon(emoji: str, size: int = 128,
+               bg_rgb=(32, 48, 79), fg_rgb=(220, 230, 255)) -> QIcon:
+    pm = QPixmap(size, size)
+    pm.fill(Qt.transparent)
+    painter = QPainter(pm)
+    try:
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setBrush(QColor(*bg_rgb))
+        painter.setPen(Qt.NoPen)
+        painter.drawEllipse(0, 0, size, size)
+        font = QFont()
+        font.setPointSize(int(size * 0.55))
+        painter.setFont(font)
+        painter.setPen(QColor(*fg_rgb))
+        painter.drawText(pm.rect(), Qt.AlignCenter, emoji)
+    finally:
+        painter.end()
+    return QIcon(pm)
+
+# ---------------- Tray icon (rendered on first use, after QApplication exists) ----------------
+def tray_icon() -> QIcon:
+    return emoji_icon("🚀", 32)